@@ -1,16 +1,217 @@
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
 import logging
+from logging.handlers import RotatingFileHandler
 import os
+import sqlite3
 from pathlib import Path
-from typing import Optional, List
-from sqlalchemy import create_engine, Table, Column, Float, DateTime, String, MetaData, Integer
+from typing import Dict, Iterator, Optional, List, Set, Union
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the pandas C parser
+    pa = None
+    pa_csv = None
+from sqlalchemy import create_engine, event, inspect, select, and_, Index, Table, Column, Float, BigInteger, String, MetaData, Integer
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+
+# Mapping of CSV headers to crypto_prices columns
+CSV_COLUMN_MAP = {
+    'Symbol': 'symbol',
+    'Name': 'name',
+    'Price': 'price',
+    'Market Cap': 'market_cap',
+    'Volume (24h)': 'volume_24h',
+    'Volume Change (24h)': 'volume_change_24h',
+    'Volume Change (30d)': 'volume_change_30d',
+    '1h %': 'percent_change_1h',
+    '24h %': 'percent_change_24h',
+    '7d %': 'percent_change_7d',
+    '60d %': 'percent_change_60d',
+    '90d %': 'percent_change_90d',
+    'YTD %': 'percent_change_ytd',
+    'Circulating Supply': 'circulating_supply',
+    'Total Supply': 'total_supply',
+    'Max Supply': 'max_supply',
+    'Num Market Pairs': 'num_market_pairs'
+}
+
+# Parser dtypes for the CSV columns we load; also used as usecols so the
+# reader skips inference and any columns not listed here
+CSV_DTYPES = {
+    header: 'float64' for header in CSV_COLUMN_MAP
+    if header not in ('Symbol', 'Name', 'Num Market Pairs')
+}
+CSV_DTYPES.update({'Symbol': 'string', 'Name': 'string', 'Num Market Pairs': 'Int64'})
+
+# Optional supply figures are read as text and coerced, so placeholders such
+# as "-" or "unlimited" become NULL instead of failing the whole file
+NULLABLE_NUMERIC_COLUMNS = ('Total Supply', 'Max Supply')
+CSV_DTYPES.update({header: 'string' for header in NULLABLE_NUMERIC_COLUMNS})
+
+# Equivalent Arrow reader options, built once at import (None without pyarrow)
+ARROW_CONVERT_OPTIONS = None
+if pa_csv is not None:
+    _arrow_types = {'float64': pa.float64(), 'string': pa.string(), 'Int64': pa.int64()}
+    ARROW_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+        column_types={col: _arrow_types[dtype] for col, dtype in CSV_DTYPES.items()},
+        include_columns=list(CSV_DTYPES)
+    )
+
+# Rows read from a CSV file per chunk when streaming it into the database
+CSV_CHUNKSIZE = 50_000
+
+# Bytes sampled from the start of a CSV file to estimate its row width, which
+# is also the smallest Arrow block so one block always holds whole rows
+CSV_SAMPLE_BYTES = 64 * 1024
+
+# Size and number of rotated crypto_collector.log files
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Records per executemany call when saving record lists
+BATCH_SIZE = 5000
+
+# Maximum rows per prepared multi-row upsert in _df_to_table
+INSERT_PAGE_SIZE = 1000
+
+def _sqlite_max_variables() -> int:
+    """Return the bound-parameter limit of the linked SQLite library."""
+    conn = sqlite3.connect(':memory:')
+    try:
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:
+        # Connection.getlimit needs Python 3.11; fall back to the default
+        # compile-time limit, which SQLite raised from 999 in 3.32
+        return 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+    finally:
+        conn.close()
+
+# Bound-parameter limit of the runtime SQLite, detected once at import
+SQLITE_MAX_VARIABLES = _sqlite_max_variables()
+
+# Per-connection SQLite tuning: WAL lets readers run alongside the writer and
+# synchronous=NORMAL only fsyncs at checkpoints instead of on every commit
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456"
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to a newly opened DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+def _to_epoch_us(value: Union[datetime, date, str]) -> int:
+    """Convert a datetime, date or ISO string to integer microseconds since the Unix epoch."""
+    return pd.Timestamp(value).value // 1_000
+
+class EpochMicroseconds(TypeDecorator):
+    """
+    Timestamp stored as an INTEGER count of microseconds since the epoch.
+
+    Binds accept integers or anything pd.Timestamp parses (datetimes, dates,
+    ISO strings); reads return the raw integers so callers can convert whole
+    columns at once with pd.to_datetime(unit='us').
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, (int, np.integer)):
+            return value
+        # SQLite orders every INTEGER before any TEXT, so an unconverted
+        # string or date bound would silently match nothing
+        return _to_epoch_us(value)
+
+# On-disk schema version recorded in PRAGMA user_version; databases below it
+# are migrated once by setup_database
+SCHEMA_VERSION = 1
+
+metadata = MetaData()
+
+# Table for storing crypto price data
+prices_table = Table(
+    'crypto_prices', 
+    metadata,
+    Column('timestamp', EpochMicroseconds, primary_key=True),
+    Column('symbol', String, primary_key=True),
+    Column('name', String),
+    Column('price', Float),
+    Column('market_cap', Float),
+    Column('volume_24h', Float),
+    Column('volume_change_24h', Float),
+    Column('volume_change_30d', Float),
+    Column('percent_change_1h', Float),
+    Column('percent_change_24h', Float),
+    Column('percent_change_7d', Float),
+    Column('percent_change_60d', Float),
+    Column('percent_change_90d', Float),
+    Column('percent_change_ytd', Float),
+    Column('circulating_supply', Float),
+    Column('total_supply', Float),
+    Column('max_supply', Float),
+    Column('num_market_pairs', Integer)
+)
+
+# Symbol-leading index so symbol filters seek instead of scanning
+prices_symbol_index = Index(
+    'ix_prices_symbol_ts',
+    prices_table.c.symbol,
+    prices_table.c.timestamp
+)
+
+def _upsert_columns(table: Table) -> List[str]:
+    """
+    Return the columns an upsert overwrites on conflict.
+
+    Every non-key column is set from the new row, so columns the new row
+    leaves out are reset to NULL just as a fresh insert would leave them.
+    """
+    return [col.name for col in table.columns if not col.primary_key]
+
+# Upsert statement built once and reused by every save; ON CONFLICT updates
+# an existing row in place rather than deleting and re-inserting it
+prices_upsert = sqlite_insert(prices_table)
+prices_upsert = prices_upsert.on_conflict_do_update(
+    index_elements=[col.name for col in prices_table.primary_key],
+    set_={key: prices_upsert.excluded[key] for key in _upsert_columns(prices_table)}
+)
 
 class CryptoDataCollector:
-    def __init__(self, project_root: Optional[str] = None):
-        """Initialize the CryptoDataCollector with database connection."""
+    # Engines and initialized schemas shared by every collector, keyed by URL
+    _engines: Dict[str, Engine] = {}
+    _schema_ready: Set[str] = set()
+
+    def __init__(
+        self,
+        project_root: Optional[str] = None,
+        reset: bool = False,
+        batch_size: int = BATCH_SIZE
+    ):
+        """
+        Initialize the CryptoDataCollector with database connection.
+
+        Args:
+            project_root: Directory holding data/ and the database (defaults
+                to the repository root)
+            reset: Delete any existing database before connecting
+            batch_size: Records per executemany call in save_to_database
+        """
+        self.batch_size = batch_size
+
         if project_root is None:
             # Assume you are in src/data and need to move up two levels
             self.project_root = Path(__file__).parent.parent.parent
@@ -24,66 +225,106 @@ class CryptoDataCollector:
         # Create data directory if one does not exist
         self.data_dir.mkdir(exist_ok=True)
 
-        if self.db_path.exists():
+        db_url = f"sqlite:///{self.db_path}"
+
+        if reset and self.db_path.exists():
             try:
+                # Close pooled connections before removing the file
+                self._discard_engine(db_url)
                 self.db_path.unlink()
+                # Drop WAL sidecar files left behind by the previous database
+                for suffix in ('-wal', '-shm'):
+                    Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
                 print(f"Existing database removed: {self.db_path}")
             except Exception as e:
                 print(f"Error removing database: {str(e)}")
 
         # Initialize database connection
-        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        self.engine = self._get_engine(db_url)
         self.setup_logging()
         self.setup_database()
 
+    @classmethod
+    def _get_engine(cls, url: str) -> Engine:
+        """Return the shared engine for a database URL, creating it once."""
+        engine = cls._engines.get(url)
+        if engine is None:
+            engine = create_engine(url)
+            if engine.url.database not in (None, '', ':memory:'):
+                event.listen(engine, 'connect', _set_sqlite_pragmas)
+            cls._engines[url] = engine
+        return engine
+
+    @classmethod
+    def _discard_engine(cls, url: str) -> None:
+        """Dispose of the shared engine for a URL and forget its schema."""
+        engine = cls._engines.pop(url, None)
+        if engine is not None:
+            engine.dispose()
+        cls._schema_ready.discard(url)
 
     def setup_logging(self):
         """Configure logging for the data collector."""
-        if not logging.getLogger().hasHandlers():
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler('crypto_collector.log'),
-                    logging.StreamHandler()
-                ]
-            )
         self.logger = logging.getLogger(__name__)
 
-    def setup_database(self):
-        """Set up database tables."""
-        metadata = MetaData()
-
-        # Table for storing crypto price data
-        self.prices_table = Table(
-            'crypto_prices', 
-            metadata,
-            Column('timestamp', DateTime, primary_key=True),
-            Column('symbol', String, primary_key=True),
-            Column('name', String),
-            Column('price', Float),
-            Column('market_cap', Float),
-            Column('volume_24h', Float),
-            Column('volume_change_24h', Float),
-            Column('volume_change_30d', Float),
-            Column('percent_change_1h', Float),
-            Column('percent_change_24h', Float),
-            Column('percent_change_7d', Float),
-            Column('percent_change_60d', Float),
-            Column('percent_change_90d', Float),
-            Column('percent_change_ytd', Float),
-            Column('circulating_supply', Float),
-            Column('total_supply', Float),
-            Column('max_supply', Float),
-            Column('num_market_pairs', Integer)
+        # Configure handlers once per process; later collectors reuse them
+        if logging.getLogger().hasHandlers():
+            return
+
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                RotatingFileHandler(
+                    'crypto_collector.log',
+                    maxBytes=LOG_MAX_BYTES,
+                    backupCount=LOG_BACKUP_COUNT
+                ),
+                logging.StreamHandler()
+            ]
         )
 
-        metadata.create_all(self.engine)
+    def setup_database(self):
+        """Set up database tables."""
+        self.prices_table = prices_table
+
+        # Create the schema once per engine
+        db_url = str(self.engine.url)
+        if db_url in self._schema_ready:
+            return
+
+        with self.engine.begin() as conn:
+            if not inspect(conn).has_table(prices_table.name):
+                metadata.create_all(conn)
+            else:
+                # Databases created before the index was added lack it
+                prices_symbol_index.create(conn, checkfirst=True)
+
+            if conn.exec_driver_sql("PRAGMA user_version").scalar() < SCHEMA_VERSION:
+                # Migrate timestamps written as ISO text by older versions;
+                # typeof() can't use an index, so this full scan runs only once
+                conn.exec_driver_sql(
+                    "UPDATE crypto_prices "
+                    "SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER) * 1000000"
+                    " + CAST(substr(timestamp, 21, 6) AS INTEGER) "
+                    "WHERE typeof(timestamp) = 'text'"
+                )
+                conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._schema_ready.add(db_url)
         self.logger.info("Database tables created successfully")
 
-    def process_csv_data(self, file_path: str) -> None:
+    def process_csv_data(self, file_path: str, chunksize: int = CSV_CHUNKSIZE) -> None:
         """
         Process cryptocurrency data from CSV file and store in database.
+
+        The file is streamed in chunks so memory use is bounded by chunksize
+        rather than file size; all chunks are written in one transaction.
+
+        Args:
+            file_path: CSV path relative to the project root
+            chunksize: Number of CSV rows to read and insert at a time (with
+                pyarrow, the approximate rows per block, at least
+                CSV_SAMPLE_BYTES of the file)
         """
         # Convert relative path to absolute using project root
         full_path = self.project_root / file_path
@@ -93,78 +334,221 @@ class CryptoDataCollector:
             if not full_path.exists():
                 raise FileNotFoundError(f"CSV file not found: {full_path}")
             
-            # Read CSV file
-            df = pd.read_csv(full_path)
-            
             # Process timestamp
             current_time = datetime.now()
-            
-            # Prepare records
-            records = []
-            
-            for _, row in df.iterrows():
-                # Price data record
-                record = {
-                    'timestamp': current_time,
-                    'symbol': row['Symbol'],
-                    'name': row['Name'],
-                    'price': float(row['Price']),
-                    'market_cap': float(row['Market Cap']),
-                    'volume_24h': float(row['Volume (24h)']),
-                    'percent_change_1h': float(row['1h %']),
-                    'percent_change_24h': float(row['24h %']),
-                    'percent_change_7d': float(row['7d %']),
-                    'percent_change_60d': float(row['60d %']),
-                    'percent_change_90d': float(row['90d %']),
-                    'percent_change_ytd': float(row['YTD %']),
-                    'market_cap': float(row['Market Cap']),
-                    'volume_24h': float(row['Volume (24h)']),
-                    'volume_change_24h': float(row['Volume Change (24h)']),
-                    'volume_change_30d': float(row['Volume Change (30d)']),
-                    'circulating_supply': float(row['Circulating Supply']),
-                    'total_supply': float(row['Total Supply']) if pd.notna(row['Total Supply']) else None,
-                    'max_supply': float(row['Max Supply']) if pd.notna(row['Max Supply']) else None,
-                    'num_market_pairs': int(row['Num Market Pairs'])
-                }
-                records.append(record)
-                
-
-            # Save to database
-            self.save_to_database(records)
-            self.logger.info(f"Successfully processed {len(records)} cryptocurrencies from CSV")
+            total_rows = 0
+
+            # On the initial load into an empty table, build the secondary
+            # index once afterwards instead of updating it for every row
+            initial_load = self._is_empty(self.prices_table)
+            if initial_load:
+                prices_symbol_index.drop(self.engine, checkfirst=True)
+
+            try:
+                # Read CSV file in chunks and save each one to the database
+                with self.engine.begin() as conn:
+                    for chunk in self._read_csv_chunks(full_path, chunksize):
+                        chunk = self._normalize_csv_chunk(chunk, current_time)
+                        self._df_to_table(chunk, self.prices_table, conn)
+                        total_rows += len(chunk)
+            finally:
+                if initial_load:
+                    prices_symbol_index.create(self.engine, checkfirst=True)
+
+            # Gather planner statistics once the initial load and index exist
+            if initial_load:
+                with self.engine.begin() as conn:
+                    conn.exec_driver_sql(f"ANALYZE {self.prices_table.name}")
+
+            self.logger.info("Successfully saved data to database")
+            self.logger.info(f"Successfully processed {total_rows} cryptocurrencies from CSV")
 
         except Exception as e:
             self.logger.error(f"Error processing CSV file: {str(e)}")
             raise
 
-    def save_to_database(self, records: List[dict]) -> None:
+    def _is_empty(self, table: Table) -> bool:
+        """Return True if the table has no rows."""
+        with self.engine.connect() as conn:
+            return conn.execute(select(table).limit(1)).first() is None
+
+    def _read_csv_chunks(self, full_path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Stream a CSV file as DataFrames with the CSV_DTYPES columns.
+
+        Uses pyarrow's multithreaded streaming reader when it is installed,
+        yielding one Arrow-backed frame per parsed block, with blocks sized to
+        hold about chunksize rows; otherwise falls back to the pandas C parser
+        in chunks of exactly chunksize rows.
+
+        Args:
+            full_path: Absolute path to the CSV file
+            chunksize: Rows per chunk
+        """
+        if pa_csv is None:
+            yield from pd.read_csv(
+                full_path,
+                usecols=list(CSV_DTYPES),
+                dtype=CSV_DTYPES,
+                engine='c',
+                # Parse floats exactly as pyarrow does so both readers store
+                # the same values
+                float_precision='round_trip',
+                chunksize=chunksize
+            )
+            return
+
+        read_options = pa_csv.ReadOptions(block_size=self._csv_block_size(full_path, chunksize))
+        with pa_csv.open_csv(
+            full_path,
+            read_options=read_options,
+            convert_options=ARROW_CONVERT_OPTIONS
+        ) as reader:
+            for batch in reader:
+                yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def _csv_block_size(self, full_path: Path, chunksize: int) -> int:
+        """
+        Estimate the Arrow block size in bytes that holds chunksize rows.
+
+        Arrow splits files by bytes rather than rows, so the average row width
+        is measured on the first CSV_SAMPLE_BYTES of the file.
+
+        Args:
+            full_path: Absolute path to the CSV file
+            chunksize: Rows wanted per block
+        """
+        with open(full_path, 'rb') as f:
+            sample = f.read(CSV_SAMPLE_BYTES)
+        row_bytes = len(sample) / max(1, sample.count(b'\n'))
+        return max(CSV_SAMPLE_BYTES, int(row_bytes * chunksize))
+
+    def _normalize_csv_chunk(self, df: pd.DataFrame, timestamp: datetime) -> pd.DataFrame:
+        """
+        Convert a raw CSV chunk into crypto_prices columns.
+
+        Args:
+            df: Chunk as read from the CSV file
+            timestamp: Collection time stamped on every row
+
+        Returns:
+            DataFrame whose columns match the crypto_prices table
+        """
+        # Coerce optional numerics, then rename CSV headers to table columns;
+        # the remaining dtypes are set by the reader
+        for header in NULLABLE_NUMERIC_COLUMNS:
+            df[header] = pd.to_numeric(df[header], errors='coerce')
+        df = df.rename(columns=CSV_COLUMN_MAP)[list(CSV_COLUMN_MAP.values())]
+        df['timestamp'] = _to_epoch_us(timestamp)
+        return df
+
+    def _df_to_table(self, df: pd.DataFrame, table: Table, conn: Connection) -> None:
+        """
+        Upsert a DataFrame into a table with batched multi-row INSERT ... ON CONFLICT.
+
+        Args:
+            df: DataFrame whose columns are a subset of the table columns
+            table: Target table
+            conn: Connection whose transaction the rows are written in
+
+        Raises:
+            ValueError: If df has columns the table does not define
+        """
+        # Column names end up in the SQL text, so only accept the table's own
+        unknown = set(df.columns) - set(table.c.keys())
+        if unknown:
+            raise ValueError(f"Columns not in {table.name}: {sorted(unknown)}")
+
+        quote = conn.dialect.identifier_preparer.quote
+        columns = ', '.join(quote(key) for key in df.columns)
+        row_placeholders = f"({', '.join('?' * len(df.columns))})"
+
+        # Update existing rows in place with the same columns as prices_upsert
+        conflict_target = ', '.join(quote(col.name) for col in table.primary_key)
+        updates = ', '.join(
+            f"{quote(key)} = excluded.{quote(key)}" for key in _upsert_columns(table)
+        )
+        on_conflict = f"ON CONFLICT ({conflict_target}) " + (
+            f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        )
+
+        # Emit prepared multi-row statements directly to the driver; compiling
+        # a Core insert for every batch would dominate load time
+        def upsert(pd_table, conn, keys, data_iter):
+            rows = list(data_iter)
+            statement = (
+                f"INSERT INTO {quote(table.name)} ({columns}) "
+                f"VALUES {', '.join([row_placeholders] * len(rows))} {on_conflict}"
+            )
+            params = tuple(value for row in rows for value in row)
+            return conn.exec_driver_sql(statement, params).rowcount
+
+        # Fill each statement up to SQLite's bound-parameter limit, capped so
+        # a single statement's SQL text stays small
+        chunksize = max(1, min(INSERT_PAGE_SIZE, SQLITE_MAX_VARIABLES // len(df.columns)))
+
+        df.to_sql(
+            table.name,
+            conn,
+            if_exists='append',
+            index=False,
+            chunksize=chunksize,
+            method=upsert
+        )
+
+    def save_to_database(
+        self,
+        records: Union[List[dict], pd.DataFrame],
+        conn: Optional[Connection] = None
+    ) -> None:
         """
         Save cryptocurrency data to database.
         
         Args:
-            price_records: List of price data records
-            metadata_records: List of metadata records
+            records: List of price data records, or a DataFrame of
+                crypto_prices columns with timestamp either as a column or as
+                the index, as returned by get_crypto_data (written with
+                multi-row upserts)
+            conn: Open connection to write in; pass one to batch several saves
+                into the caller's transaction (None opens and commits a new one)
+
+        Raises:
+            ValueError: If a DataFrame has no timestamp column or index, or
+                has columns crypto_prices does not define
         """
-        Session = sessionmaker(bind=self.engine)
-        session = Session()
+        transaction = self.engine.begin() if conn is None else nullcontext(conn)
 
         try:
-            # Save data
-            if records:
-                session.execute(
-                    self.prices_table.insert().prefix_with('OR REPLACE'),
-                    records
-                )
+            if isinstance(records, pd.DataFrame):
+                if 'timestamp' not in records.columns:
+                    if records.index.name != 'timestamp':
+                        raise ValueError(
+                            "DataFrame records need a 'timestamp' column or index"
+                        )
+                    records = records.reset_index()
+
+                # The frame is written below the Core layer, so convert
+                # datetimes to epoch microseconds as EpochMicroseconds would
+                if not pd.api.types.is_integer_dtype(records['timestamp']):
+                    timestamps = pd.to_datetime(records['timestamp']).dt.as_unit('us')
+                    records = records.assign(timestamp=timestamps.astype('int64'))
+
+                with transaction as conn:
+                    self._df_to_table(records, self.prices_table, conn)
+                self.logger.info("Successfully saved data to database")
+                return
+
+            # Save data in batch_size slices inside a single transaction so
+            # large inputs are handed to SQLite in bounded pieces
+            with transaction as conn:
+                for start in range(0, len(records), self.batch_size):
+                    conn.execute(prices_upsert, records[start:start + self.batch_size])
 
-            session.commit()
             self.logger.info("Successfully saved data to database")
 
         except SQLAlchemyError as e:
-            session.rollback()
             self.logger.error(f"Database error: {str(e)}")
             raise
-        finally:
-            session.close()
 
     def get_crypto_data(
         self,
@@ -176,34 +560,45 @@ class CryptoDataCollector:
         Retrieve cryptocurrency data from database.
         
         Args:
-            crypto_ids: List of cryptocurrency IDs (None for all)
+            crypto_ids: List of cryptocurrency symbols (None for all)
             start_date: Start date for filtering
             end_date: End date for filtering
             
         Returns:
-            DataFrame containing price data
+            DataFrame containing price data indexed by timestamp, with symbol
+            as a categorical column
         """
         
-        query = query = "SELECT * FROM crypto_prices"
+        # Bound parameters let SQLite reuse the prepared statement
+        query = select(self.prices_table)
         conditions = []
 
         if crypto_ids:
-            crypto_list = ", ".join(f"'{id}'" for id in crypto_ids)
-            conditions.append(f"crypto_id IN ({crypto_list})")
+            conditions.append(self.prices_table.c.symbol.in_(crypto_ids))
 
         if start_date:
-            conditions.append(f"timestamp >= '{start_date}'")
+            conditions.append(self.prices_table.c.timestamp >= start_date)
         
         if end_date:
-            conditions.append(f"timestamp <= '{end_date}'")
+            conditions.append(self.prices_table.c.timestamp <= end_date)
 
         if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+            query = query.where(and_(*conditions))
+
+        # Return rows already in index order so pandas does no post-read sort
+        query = query.order_by(self.prices_table.c.timestamp)
 
         try:
-            df = pd.read_sql(query, self.engine)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df.set_index('timestamp', inplace=True)
+            df = pd.read_sql_query(
+                query,
+                self.engine,
+                index_col='timestamp'
+            )
+            df.index = pd.to_datetime(df.index, unit='us')
+
+            # Symbols repeat once per stored snapshot; as a category each
+            # distinct string is held once and rows carry small integer codes
+            df['symbol'] = df['symbol'].astype('category')
             return df
 
         except Exception as e:
@@ -212,32 +607,30 @@ class CryptoDataCollector:
 
 if __name__ == "__main__":
     
-    collector = CryptoDataCollector()
+    collector = CryptoDataCollector(reset=True)
 
     # Configure pandas display options
     pd.set_option('display.max_columns', None)
     pd.set_option('display.width', None)
 
-    def format_number(value):
+    def format_number(values):
         """Format large numbers to human-readable format"""
-        if pd.isna(value):
-            return "N/A"
-        
-        abs_value= abs(value)
-        if abs_value >= 1_000_000_000:   # Billions
-            return f"${value/1_000_000_000:.2f}B"
-        elif abs_value >= 1_000_000:     # Millions
-            return f"${value/1_000_000:.2f}M"
-        elif abs_value >= 1_000:         # Thousands
-            return f"${value/1_000:.2f}K"
-        else:
-            return f"${value:.2f}"
+        v = values.to_numpy(dtype='float64', na_value=np.nan)
+        abs_v = np.abs(v)
+
+        # Billions, millions, thousands
+        conditions = [abs_v >= 1_000_000_000, abs_v >= 1_000_000, abs_v >= 1_000]
+        scale = np.select(conditions, [1_000_000_000, 1_000_000, 1_000], default=1)
+        unit = np.select(conditions, ['B', 'M', 'K'], default='')
+
+        text = np.char.add(np.char.add('$', np.char.mod('%.2f', v / scale)), unit)
+        return pd.Series(np.where(np.isnan(v), 'N/A', text), index=values.index)
     
-    def format_percentage(value):
+    def format_percentage(values):
         """Format percentage values"""
-        if pd.isna(value):
-            return "N/A"
-        return f"{value:.2f}%"
+        v = values.to_numpy(dtype='float64', na_value=np.nan)
+        text = np.char.add(np.char.mod('%.2f', v), '%')
+        return pd.Series(np.where(np.isnan(v), 'N/A', text), index=values.index)
     
     
     # Process CSV file
@@ -254,16 +647,16 @@ if __name__ == "__main__":
 
     # Format the numeric columns
     formatted_data = top_10_crypto.copy()
-    formatted_data['market_cap'] = formatted_data['market_cap'].apply(format_number)
-    formatted_data['volume_24h'] = formatted_data['volume_24h'].apply(format_number)
-    formatted_data['price'] = formatted_data['price'].apply(format_number)
+    formatted_data['market_cap'] = format_number(formatted_data['market_cap'])
+    formatted_data['volume_24h'] = format_number(formatted_data['volume_24h'])
+    formatted_data['price'] = format_number(formatted_data['price'])
     
     # Format percentage columns
     percentage_columns = ['percent_change_1h', 'percent_change_24h', 'percent_change_7d', 
                          'percent_change_60d', 'percent_change_90d', 'percent_change_ytd']
     
     for col in percentage_columns:
-        formatted_data[col] = formatted_data[col].apply(format_percentage)
+        formatted_data[col] = format_percentage(formatted_data[col])
     
     # # Select and reorder columns for display
     columns_to_display = [
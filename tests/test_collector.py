@@ -0,0 +1,417 @@
+import shutil
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from src.data import collector as collector_module
+from src.data.collector import CryptoDataCollector, SCHEMA_VERSION
+
+REPO_ROOT = Path(__file__).parent.parent
+CSV_NAME = 'crypto_trends_insights_2024.csv'
+
+
+@pytest.fixture
+def project_root(tmp_path, monkeypatch):
+    """Empty project directory; also the cwd so the log file lands there."""
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    CryptoDataCollector._discard_engine(f"sqlite:///{tmp_path / 'crypto_data.db'}")
+
+
+def _stored_rows(collector, sql):
+    with sqlite3.connect(collector.db_path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+# crypto_prices as created by the versions that stored ISO text timestamps
+LEGACY_SCHEMA = """
+CREATE TABLE crypto_prices (
+    timestamp DATETIME NOT NULL,
+    symbol VARCHAR NOT NULL,
+    name VARCHAR,
+    price FLOAT,
+    market_cap FLOAT,
+    volume_24h FLOAT,
+    volume_change_24h FLOAT,
+    volume_change_30d FLOAT,
+    percent_change_1h FLOAT,
+    percent_change_24h FLOAT,
+    percent_change_7d FLOAT,
+    percent_change_60d FLOAT,
+    percent_change_90d FLOAT,
+    percent_change_ytd FLOAT,
+    circulating_supply FLOAT,
+    total_supply FLOAT,
+    max_supply FLOAT,
+    num_market_pairs INTEGER,
+    PRIMARY KEY (timestamp, symbol)
+)
+"""
+
+
+def test_migrates_text_timestamps_once(project_root):
+    """A database written with ISO text timestamps is converted in place."""
+    legacy_rows = [
+        ('2024-12-24 08:00:00', 'BTC', 1.0),
+        ('2024-12-25 23:14:30.347284', 'BTC', 2.0),
+        ('2024-12-25 23:14:30.347284', 'ETH', 3.0)
+    ]
+    with sqlite3.connect(project_root / 'crypto_data.db') as conn:
+        conn.execute(LEGACY_SCHEMA)
+        conn.executemany(
+            "INSERT INTO crypto_prices (timestamp, symbol, price) VALUES (?, ?, ?)",
+            legacy_rows
+        )
+
+    collector = CryptoDataCollector(project_root=project_root)
+
+    stored = _stored_rows(
+        collector,
+        "SELECT typeof(timestamp), timestamp, symbol FROM crypto_prices ORDER BY price"
+    )
+    assert stored == [
+        ('integer', pd.Timestamp(text).value // 1_000, symbol)
+        for text, symbol, _ in legacy_rows
+    ]
+    assert _stored_rows(collector, "PRAGMA user_version") == [(SCHEMA_VERSION,)]
+
+    collected = datetime(2024, 12, 25, 23, 14, 30, 347284)
+    data = collector.get_crypto_data(start_date=collected, end_date=collected)
+    assert sorted(data['symbol'].astype(str)) == ['BTC', 'ETH']
+    assert list(collector.get_crypto_data(end_date=datetime(2024, 12, 25))['price']) == [1.0]
+    assert collector.get_crypto_data(start_date=datetime(2025, 1, 1)).empty
+
+    # Once the version is recorded, later startups skip the full-table scan
+    with sqlite3.connect(collector.db_path) as conn:
+        conn.execute("UPDATE crypto_prices SET timestamp = '2024-12-25 00:00:00' WHERE price = 1.0")
+    CryptoDataCollector._discard_engine(str(collector.engine.url))
+    CryptoDataCollector(project_root=project_root)
+    untouched = _stored_rows(collector, "SELECT typeof(timestamp) FROM crypto_prices WHERE price = 1.0")
+    assert untouched == [('text',)]
+
+
+@pytest.mark.parametrize(
+    'bound',
+    ['2024-12-25', date(2024, 12, 25), datetime(2024, 12, 25), pd.Timestamp('2024-12-25')],
+    ids=['str', 'date', 'datetime', 'timestamp']
+)
+def test_date_filters_accept_str_and_date(project_root, bound):
+    collector = CryptoDataCollector(project_root=project_root)
+    collector.save_to_database([
+        {'timestamp': datetime(2024, 12, 24, 12), 'symbol': 'BTC', 'price': 1.0},
+        {'timestamp': datetime(2024, 12, 25, 12), 'symbol': 'BTC', 'price': 2.0}
+    ])
+
+    assert list(collector.get_crypto_data(start_date=bound)['price']) == [2.0]
+    assert list(collector.get_crypto_data(end_date=bound)['price']) == [1.0]
+
+
+@pytest.fixture(params=['pyarrow', 'pandas'])
+def csv_reader(request, monkeypatch):
+    """Run once with the pyarrow reader and once with the pandas fallback."""
+    if request.param == 'pandas':
+        monkeypatch.setattr(collector_module, 'pa_csv', None)
+    elif collector_module.pa_csv is None:
+        pytest.skip('pyarrow is not installed')
+    return request.param
+
+
+@pytest.fixture
+def loaded_collector(project_root, csv_reader):
+    """Collector whose database holds the bundled CSV snapshot."""
+    (project_root / 'data').mkdir()
+    shutil.copy(REPO_ROOT / 'data' / CSV_NAME, project_root / 'data' / CSV_NAME)
+    collector = CryptoDataCollector(project_root=project_root)
+    collector.process_csv_data(f'data/{CSV_NAME}')
+    return collector
+
+
+def test_get_crypto_data_returns_categorical_symbols(loaded_collector):
+    data = loaded_collector.get_crypto_data(crypto_ids=['BTC', 'ETH'])
+
+    assert isinstance(data['symbol'].dtype, pd.CategoricalDtype)
+    assert sorted(data['symbol'].astype(str)) == ['BTC', 'ETH']
+    assert isinstance(data.index, pd.DatetimeIndex)
+
+
+def test_save_dataframe_sizes_statements_to_variable_limit(project_root, monkeypatch):
+    """Rows are grouped into multi-row statements within SQLITE_MAX_VARIABLES."""
+    collector = CryptoDataCollector(project_root=project_root)
+    frame = pd.DataFrame({
+        'timestamp': pd.Timestamp('2024-12-25 12:00:00'),
+        'symbol': [f'SYM{i}' for i in range(7)],
+        'price': [float(i) for i in range(7)]
+    })
+    # Three columns with a 7-variable limit leaves room for two rows per statement
+    monkeypatch.setattr(collector_module, 'SQLITE_MAX_VARIABLES', 7)
+
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT'):
+            statements.append(len(parameters))
+    event.listen(collector.engine, 'before_cursor_execute', record)
+    try:
+        collector.save_to_database(frame)
+    finally:
+        event.remove(collector.engine, 'before_cursor_execute', record)
+
+    assert statements == [6, 6, 6, 3]
+    assert _stored_rows(collector, "SELECT count(*) FROM crypto_prices") == [(7,)]
+
+
+def test_save_dataframe_writes_missing_values_as_null(project_root):
+    collector = CryptoDataCollector(project_root=project_root)
+    frame = pd.DataFrame({
+        'timestamp': [pd.Timestamp('2024-12-25 12:00:00')] * 2,
+        'symbol': ['BTC', 'ETH'],
+        'price': [100.0, np.nan],
+        'num_market_pairs': pd.array([12, pd.NA], dtype='Int64')
+    })
+
+    collector.save_to_database(frame)
+
+    rows = _stored_rows(
+        collector,
+        "SELECT symbol, price, typeof(price), num_market_pairs, typeof(num_market_pairs) "
+        "FROM crypto_prices ORDER BY symbol"
+    )
+    assert rows == [('BTC', 100.0, 'real', 12, 'integer'), ('ETH', None, 'null', None, 'null')]
+
+
+def test_save_dataframe_rejects_unknown_columns(project_root):
+    collector = CryptoDataCollector(project_root=project_root)
+    frame = pd.DataFrame({
+        'timestamp': [pd.Timestamp('2024-12-25 12:00:00')],
+        'symbol': ['BTC'],
+        'price" = 0; DROP TABLE crypto_prices; --': [1.0]
+    })
+
+    with pytest.raises(ValueError, match='Columns not in crypto_prices'):
+        collector.save_to_database(frame)
+    assert _stored_rows(collector, "SELECT count(*) FROM crypto_prices") == [(0,)]
+
+
+@pytest.mark.parametrize('as_frame', [False, True], ids=['records', 'dataframe'])
+def test_upsert_replaces_existing_row(project_root, as_frame):
+    """Both save paths overwrite every non-key column of an existing row."""
+    collector = CryptoDataCollector(project_root=project_root)
+    collected = datetime(2024, 12, 25, 12, 0, 0, 123456)
+
+    def save(records):
+        collector.save_to_database(pd.DataFrame(records) if as_frame else records)
+
+    save([{'timestamp': collected, 'symbol': 'EX', 'name': 'Ex', 'price': 1.0}])
+    save([{'timestamp': collected, 'symbol': 'EX', 'price': 2.0}])
+
+    rows = _stored_rows(collector, "SELECT timestamp, symbol, name, price FROM crypto_prices")
+    assert rows == [(pd.Timestamp(collected).value // 1_000, 'EX', None, 2.0)]
+
+
+def test_save_dataframe_from_get_crypto_data(loaded_collector):
+    """Frames read back with a timestamp index can be saved unchanged."""
+    query = "SELECT * FROM crypto_prices ORDER BY symbol"
+    before = _stored_rows(loaded_collector, query)
+    data = loaded_collector.get_crypto_data()
+
+    loaded_collector.save_to_database(data)
+
+    assert _stored_rows(loaded_collector, query) == before
+
+
+def test_save_dataframe_requires_timestamp(project_root):
+    collector = CryptoDataCollector(project_root=project_root)
+    frame = pd.DataFrame({'symbol': ['BTC'], 'price': [1.0]})
+
+    with pytest.raises(ValueError, match="'timestamp' column or index"):
+        collector.save_to_database(frame)
+
+
+def test_normalize_csv_chunk_columns(project_root):
+    """Each crypto_prices column appears exactly once after normalizing."""
+    collector = CryptoDataCollector(project_root=project_root)
+    chunk = next(collector._read_csv_chunks(REPO_ROOT / 'data' / CSV_NAME, 100))
+
+    df = collector._normalize_csv_chunk(chunk, datetime(2024, 12, 25))
+
+    expected = list(dict.fromkeys(collector_module.CSV_COLUMN_MAP.values())) + ['timestamp']
+    assert list(df.columns) == expected
+    assert not df.columns.duplicated().any()
+
+
+def test_existing_database_kept_unless_reset(project_root):
+    record = {'timestamp': datetime(2024, 12, 25), 'symbol': 'BTC', 'price': 1.0}
+    first = CryptoDataCollector(project_root=project_root)
+    first.save_to_database([record])
+
+    second = CryptoDataCollector(project_root=project_root)
+    assert second.engine is first.engine
+    assert len(second.get_crypto_data()) == 1
+
+    fresh = CryptoDataCollector(project_root=project_root, reset=True)
+    assert fresh.engine is not first.engine
+    assert fresh.get_crypto_data().empty
+
+
+def test_save_records_in_batches(project_root):
+    collector = CryptoDataCollector(project_root=project_root, batch_size=2)
+    records = [
+        {'timestamp': datetime(2024, 12, 25), 'symbol': f'SYM{i}', 'price': float(i)}
+        for i in range(5)
+    ]
+
+    batches = []
+    def record(conn, clauseelement, multiparams, params, execution_options):
+        batches.append(len(multiparams) or 1)
+    event.listen(collector.engine, 'before_execute', record)
+    try:
+        collector.save_to_database(records)
+    finally:
+        event.remove(collector.engine, 'before_execute', record)
+
+    assert batches == [2, 2, 1]
+    assert _stored_rows(collector, "SELECT count(*) FROM crypto_prices") == [(5,)]
+
+
+def _has_symbol_index(collector):
+    rows = _stored_rows(
+        collector,
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'ix_prices_symbol_ts'"
+    )
+    return bool(rows)
+
+
+def test_initial_load_rebuilds_symbol_index(loaded_collector, monkeypatch):
+    """The index is dropped only for a load into an empty table."""
+    assert _has_symbol_index(loaded_collector)
+
+    index_present = []
+    df_to_table = CryptoDataCollector._df_to_table
+    def spy(self, df, table, conn):
+        index_present.append(_has_symbol_index(self))
+        return df_to_table(self, df, table, conn)
+    monkeypatch.setattr(CryptoDataCollector, '_df_to_table', spy)
+
+    loaded_collector.process_csv_data(f'data/{CSV_NAME}')
+    assert index_present and all(index_present)
+
+
+def test_initial_load_gathers_planner_statistics(loaded_collector):
+    stats = _stored_rows(loaded_collector, "SELECT idx FROM sqlite_stat1 ORDER BY idx")
+    assert ('ix_prices_symbol_ts',) in stats
+
+
+def test_failed_initial_load_restores_symbol_index(project_root, monkeypatch):
+    (project_root / 'data').mkdir()
+    shutil.copy(REPO_ROOT / 'data' / CSV_NAME, project_root / 'data' / CSV_NAME)
+    collector = CryptoDataCollector(project_root=project_root)
+
+    index_present = []
+    def fail(self, df, table, conn):
+        index_present.append(_has_symbol_index(self))
+        raise RuntimeError('write failed')
+    monkeypatch.setattr(CryptoDataCollector, '_df_to_table', fail)
+
+    with pytest.raises(RuntimeError, match='write failed'):
+        collector.process_csv_data(f'data/{CSV_NAME}')
+
+    assert index_present == [False]
+    assert _has_symbol_index(collector)
+    assert collector.get_crypto_data().empty
+
+
+@pytest.mark.skipif(collector_module.pa_csv is None, reason='pyarrow is not installed')
+def test_csv_readers_store_identical_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    columns = ', '.join(collector_module.CSV_COLUMN_MAP.values())
+    stored = []
+    for reader_module in (collector_module.pa_csv, None):
+        monkeypatch.setattr(collector_module, 'pa_csv', reader_module)
+        root = tmp_path / ('pyarrow' if reader_module else 'pandas')
+        (root / 'data').mkdir(parents=True)
+        shutil.copy(REPO_ROOT / 'data' / CSV_NAME, root / 'data' / CSV_NAME)
+        collector = CryptoDataCollector(project_root=root)
+        try:
+            collector.process_csv_data(f'data/{CSV_NAME}')
+            stored.append(_stored_rows(collector, f"SELECT {columns} FROM crypto_prices ORDER BY symbol"))
+        finally:
+            CryptoDataCollector._discard_engine(str(collector.engine.url))
+
+    assert len(stored[0]) > 0
+    assert stored[0] == stored[1]
+
+
+def test_process_csv_data_reads_in_chunksize_pieces(loaded_collector, monkeypatch):
+    """Both readers bound each chunk by chunksize rather than file size."""
+    chunk_rows = []
+    df_to_table = CryptoDataCollector._df_to_table
+    def spy(self, df, table, conn):
+        chunk_rows.append(len(df))
+        return df_to_table(self, df, table, conn)
+    monkeypatch.setattr(CryptoDataCollector, '_df_to_table', spy)
+
+    loaded_collector.process_csv_data(f'data/{CSV_NAME}', chunksize=2000)
+
+    total = len(pd.read_csv(REPO_ROOT / 'data' / CSV_NAME, usecols=['Symbol']))
+    assert sum(chunk_rows) == total
+    assert len(chunk_rows) >= total // 4000
+    assert max(chunk_rows) <= 4000
+
+
+def test_supply_placeholders_stored_as_null(project_root, csv_reader):
+    headers = list(collector_module.CSV_COLUMN_MAP)
+    rows = [
+        # symbol, total supply, max supply
+        ('AAA', '1000.5', '2000'),
+        ('BBB', '-', 'unlimited'),
+        ('CCC', '', '')
+    ]
+    lines = [','.join(headers)]
+    for symbol, total_supply, max_supply in rows:
+        values = {header: '1' for header in headers}
+        values.update({
+            'Symbol': symbol, 'Name': symbol.title(),
+            'Total Supply': total_supply, 'Max Supply': max_supply
+        })
+        lines.append(','.join(values[header] for header in headers))
+    (project_root / 'data').mkdir()
+    (project_root / 'data' / 'supply.csv').write_text('\n'.join(lines) + '\n')
+
+    collector = CryptoDataCollector(project_root=project_root)
+    collector.process_csv_data('data/supply.csv')
+
+    stored = _stored_rows(
+        collector,
+        "SELECT symbol, total_supply, max_supply, price FROM crypto_prices ORDER BY symbol"
+    )
+    assert stored == [
+        ('AAA', 1000.5, 2000.0, 1.0),
+        ('BBB', None, None, 1.0),
+        ('CCC', None, None, 1.0)
+    ]
+
+
+def test_saves_share_the_callers_transaction(project_root):
+    """Saves given conn commit or roll back with the caller's transaction."""
+    collector = CryptoDataCollector(project_root=project_root)
+    records = [{'timestamp': datetime(2024, 12, 25), 'symbol': 'BTC', 'price': 1.0}]
+    frame = pd.DataFrame({
+        'timestamp': [pd.Timestamp('2024-12-25')], 'symbol': ['ETH'], 'price': [2.0]
+    })
+
+    with pytest.raises(RuntimeError, match='abort'):
+        with collector.engine.begin() as conn:
+            collector.save_to_database(records, conn=conn)
+            collector.save_to_database(frame, conn=conn)
+            assert conn.exec_driver_sql("SELECT count(*) FROM crypto_prices").scalar() == 2
+            raise RuntimeError('abort')
+    assert collector.get_crypto_data().empty
+
+    with collector.engine.begin() as conn:
+        collector.save_to_database(records, conn=conn)
+        collector.save_to_database(frame, conn=conn)
+    assert sorted(collector.get_crypto_data()['symbol'].astype(str)) == ['BTC', 'ETH']